@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import os
 import time
 import re
+import functools
 import pymysql
 import logging
 import warnings
@@ -20,6 +22,18 @@ NOTE_QUERY_TIME = 5
 # 需要警告的查询执行时间(秒)，日志类型 WARNING
 WARN_QUERY_TIME = 10
 
+# 查询计时使用的单调时钟(纳秒)
+try:
+    _perf_counter_ns = time.perf_counter_ns
+except AttributeError:  # python < 3.7
+    def _perf_counter_ns():
+        return int(time.perf_counter() * 1000000000)
+
+# 需要自动重连的 mysql 错误码
+# 2006: MySQL server has gone away
+# 2013: Lost connection to MySQL server during query
+_RECONNECT_ERRNOS = frozenset((2006, 2013))
+
 # 数据库默认字符集
 DB_CHARSET = 'utf8'
 
@@ -38,9 +52,47 @@ POOL_TTL = 0
 # 默认连接池连接可闲置时间(秒)
 POOL_IDLE = 30
 
+# insert/update/delete 执行前是否校验 SQL 语句类型，可通过环境变量
+# PYMYSQL_MANAGER_VALIDATE=0 关闭
+VALIDATE_SQL = os.getenv('PYMYSQL_MANAGER_VALIDATE', '1') != '0'
+
+# SQL 语句识别结果缓存大小
+SQL_CACHE_SIZE = 1024
+
 # SQL 正则模式识别符
 RE_FLAG = re.I | re.S
 
+# 预编译的 SQL 正则模式，避免每次查询时重复查找正则缓存
+_RE_LIMITED = re.compile(r'\s+limit\s+\d+', RE_FLAG)
+_RE_INSERT_SPLIT = re.compile(r'(^\s*(insert|replace)\s+.*into\s+[`\.\w]+)(.*$)', RE_FLAG)
+_RE_UPDATE_SPLIT = re.compile(r'(^\s*update\s+[`\.\w]+)\s+(.*$)', RE_FLAG)
+_RE_UPDATE_SET = re.compile(r'^\s*update\s+.*set\s+', RE_FLAG)
+_RE_TIMEZONE = re.compile(r'^[\w/:+-]+\Z')
+
+
+def _keyword(sql):
+    '''取出 SQL 语句开头的关键字(小写)，只需检查前几个字符'''
+    head = sql.lstrip()[:8].split(None, 1)
+    return head[0].lower() if head else ''
+
+
+@functools.lru_cache(maxsize=SQL_CACHE_SIZE)
+def _match_insert(sql):
+    '''拆分 insert/replace 语句模板，结果按 SQL 缓存'''
+    return _RE_INSERT_SPLIT.search(sql)
+
+
+@functools.lru_cache(maxsize=SQL_CACHE_SIZE)
+def _match_update(sql):
+    '''拆分 update 语句模板，结果按 SQL 缓存'''
+    return _RE_UPDATE_SPLIT.search(sql)
+
+
+@functools.lru_cache(maxsize=SQL_CACHE_SIZE)
+def _quote(ident):
+    '''转义标识符，结果按标识符缓存'''
+    return '`' + ident + '`'
+
 
 class SQLError(Exception):
     '''SQL 语句存在错误'''
@@ -54,36 +106,42 @@ class SQLHelper(object):
         if isinstance(sql, (bytes, bytearray)):
             sql = sql.decode('utf8')
 
-        return re.sub(r'\s+', ' ', sql)
+        # 没有可合并的空白字符时只需去掉首尾空白，与下面 split/join 的结果保持一致；
+        # 没有首尾空白时 strip 直接返回原字符串，不会重新分配
+        if '  ' not in sql and '\t' not in sql and '\n' not in sql and '\r' not in sql:
+            return sql.strip()
+
+        return ' '.join(sql.split())
 
     @classmethod
     def identifier(cls, ident):
         if isinstance(ident, str):
-            return "`%s`" % ident
+            return _quote(ident)
 
         if isinstance(ident, (tuple, list)):
-            return type(ident)(map(cls.identifier, ident))
+            return type(ident)([cls.identifier(i) for i in ident])
 
         if isinstance(ident, dict):
-            return type(ident)(zip(map(cls.identifier, ident.keys()), ident.values()))
+            return type(ident)((cls.identifier(k), v) for k, v in ident.items())
 
         raise ValueError("Invalid identifier value: %s" % type(ident))
 
     @classmethod
+    @functools.lru_cache(maxsize=SQL_CACHE_SIZE)
     def is_select(cls, sql):
-        return bool(re.search(r'^\s*select\s+.*from\s+', sql, RE_FLAG))
+        return _keyword(sql) == 'select'
 
     @classmethod
     def is_insert(cls, sql):
-        return bool(re.search(r'^\s*(insert|replace)\s+.*into\s+', sql, RE_FLAG))
+        return _keyword(sql) in ('insert', 'replace')
 
     @classmethod
     def is_update(cls, sql):
-        return bool(re.search(r'^\s*update\s+.*set\s+', sql, RE_FLAG))
+        return _keyword(sql) == 'update'
 
     @classmethod
     def is_delete(cls, sql):
-        return bool(re.search(r'^\s*delete\s+.*from\s+', sql, RE_FLAG))
+        return _keyword(sql) == 'delete'
 
     @classmethod
     def is_write(cls, sql):
@@ -94,14 +152,18 @@ class SQLHelper(object):
         return not cls.is_write(sql)
 
     @classmethod
+    @functools.lru_cache(maxsize=SQL_CACHE_SIZE)
     def is_limited(cls, sql):
-        return bool(re.search(r'\s+limit\s+\d+', sql, RE_FLAG))
+        # 先用子串查找快速排除，再用正则确认
+        return 'limit' in sql.lower() and bool(_RE_LIMITED.search(sql))
 
     @classmethod
     def limit(cls, sql, limit):
-        if cls.is_select(sql) and not cls.is_limited(sql):
-            return re.sub(r'\s*$', '', sql) + ' limit %d' % limit
-        return sql
+        if not cls.is_select(sql) or cls.is_limited(sql):
+            return sql
+
+        # 没有尾部空白时 rstrip 直接返回原字符串，不会重新分配
+        return sql.rstrip() + ' limit %d' % limit
 
 
 class Transaction(object):
@@ -146,14 +208,30 @@ class Connection(pymysql.connections.Connection):
 
     def __init__(self, timezone=DB_TIMEZONE, **kwargs):
         self._timezone = str(timezone)
+
+        # 时区只在构造时校验一次，并预先生成 set time_zone 语句
+        if self._timezone and not _RE_TIMEZONE.match(self._timezone):
+            raise ValueError("Invalid timezone value: %s" % self._timezone)
+        self._timezone_sql = "set time_zone='%s'" % self._timezone if self._timezone else None
         self._configurations = {**self._defaults, **kwargs}
         self._log_prefix = '[%s@%s] ' % (kwargs.get('host', 'localhost'),
                                          kwargs.get('database') or kwargs.get('db'))
 
+        # 复用的 cursor 对象，避免每次查询都创建新的 cursor
+        # _default_cursor 使用连接配置的 cursorclass，_tuple_cursor 使用 pymysql.cursors.Cursor
+        # 注意 cursor 持有当前连接的引用，两者构成循环引用，未调用 close() 就丢弃的连接
+        # 只能等待循环垃圾回收释放，因此在 close() 及断开 socket 时都会释放这两个 cursor
+        self._default_cursor = None
+        self._tuple_cursor = None
+
         super().__init__(**self._configurations)
 
     def log(self, level, msg, *args, **kwargs):
         '''记录一条日志'''
+        # 日志级别被过滤时，不再拼接日志前缀
+        if not logger.isEnabledFor(level):
+            return
+
         return logger.log(level, self._log_prefix + str(msg), *args, **kwargs)
 
     def connect(self, sock=None):
@@ -168,10 +246,11 @@ class Connection(pymysql.connections.Connection):
 
             self.log(logging.DEBUG, 'Create mysql connection successfully.')
 
-            if self._timezone:
-                super().query("set time_zone='%s'" % self._timezone)
+            # 每次 connect 都是新的会话，需要重新设置时区
+            if self._timezone_sql:
+                super().query(self._timezone_sql)
         except pymysql.err.MySQLError as e:
-            errno, error = list(e.args)
+            errno, error = e.args
 
             if isinstance(e, pymysql.err.Warning):
                 self.log(logging.WARN, '%s: [%d] %s', type(e), errno, error)
@@ -183,22 +262,27 @@ class Connection(pymysql.connections.Connection):
     def close(self):
         '''关闭 mysql 连接'''
         super().close()
+        self._release_cursors()
         self.log(logging.DEBUG, 'Mysql connection was closed.')
 
     def show_warnings(self):
         '''返回 mysql 警告消息'''
         ws = super().show_warnings()
 
+        if not ws or not logger.isEnabledFor(logging.WARN):
+            return ws
+
         # 记录一下 mysql 输出的警告
-        for w in ws or []:
-            self.log(logging.WARN, 'MySQL %s: [%d] %s', *w)
+        fmt = self._log_prefix + 'MySQL %s: [%d] %s'
+        for w in ws:
+            logger.warning(fmt, *w)
 
         return ws
 
     def query(self, sql, unbuffered=False):
         '''执行SQL查询，当丢失连接时自动重试，并记录查询日志'''
+        stime = _perf_counter_ns()
         try:
-            stime = time.time()
             rowcount = super().query(sql, unbuffered)
 
             self._log_query(sql, stime, rowcount)
@@ -208,19 +292,9 @@ class Connection(pymysql.connections.Connection):
             self._log_query(sql, stime, ex=e)
 
             # 当丢失连接时，尝试重新连接并执行
-            # 2006: MySQL server has gone away
-            # 2013: Lost connection to MySQL server during query
-            errno, error = list(e.args)
-            if errno in [2006, 2013]:
+            if e.args[0] in _RECONNECT_ERRNOS:
                 try:
-                    # 如果 sock 处于 open 状态，关闭它
-                    if self._sock:
-                        try:
-                            self._sock.close()
-                            self._sock = None
-                        except BaseException:
-                            pass
-
+                    self._hard_close_socket()
                     self.connect()
                     self.log(logging.INFO, 'Try to reconnect successfully.')
                 except pymysql.err.MySQLError as se:
@@ -231,40 +305,69 @@ class Connection(pymysql.connections.Connection):
 
             raise
 
+    def _hard_close_socket(self):
+        '''如果 sock 处于 open 状态，关闭它'''
+        self._release_cursors()
+
+        if self._sock:
+            try:
+                self._sock.close()
+                self._sock = None
+            except BaseException:
+                pass
+
     def _log_query(self, sql, stime, rowcount=0, ex=None):
         '''记录查询日志'''
-        elapsed = time.time() - stime
+        elapsed_ns = _perf_counter_ns() - stime
 
         # 日志级别
-        if elapsed >= NOTE_QUERY_TIME:
-            level = logging.WARN
-        if elapsed >= WARN_QUERY_TIME:
+        if ex:
+            level = logging.ERROR
+        elif elapsed_ns >= WARN_QUERY_TIME * 1000000000:
             level = logging.WARN
+        elif elapsed_ns >= NOTE_QUERY_TIME * 1000000000:
+            level = logging.INFO
         else:
             level = logging.DEBUG
 
-        msg = 'Executed: %s, Elapsed time: %.6fs, ' % (SQLHelper.inline(sql), elapsed)
+        # 日志级别被过滤时，跳过 SQL 整理及消息格式化
+        if not logger.isEnabledFor(level):
+            return
+
+        elapsed = elapsed_ns / 1e9
 
         if ex:
-            errno, error = list(ex.args)
-            msg += '%s: [%d] %s' % (type(ex), errno, error)
-            level = logging.ERROR
+            errno, error = ex.args
+            self.log(level, 'Executed: %s, Elapsed time: %.6fs, %s: [%d] %s',
+                     SQLHelper.inline(sql), elapsed, type(ex), errno, error)
         else:
-            msg += 'Affected rows: %d' % rowcount
-
-        self.log(level, msg)
+            self.log(level, 'Executed: %s, Elapsed time: %.6fs, Affected rows: %d',
+                     SQLHelper.inline(sql), elapsed, rowcount)
+
+    def _get_cursor(self, cursorclass=None):
+        '''获取可复用的 cursor 对象'''
+        attr = '_tuple_cursor' if cursorclass is pymysql.cursors.Cursor else '_default_cursor'
+        cursor = getattr(self, attr)
+        if cursor is None:
+            cursor = self.cursor(cursorclass)
+            setattr(self, attr, cursor)
+        return cursor
+
+    def _release_cursors(self):
+        '''释放复用的 cursor 对象，解除 cursor 与连接之间的循环引用'''
+        self._default_cursor = self._tuple_cursor = None
 
     def execute(self, sql, *args):
         '''调用 cursor.execute 方法'''
         if len(args) == 1 and isinstance(args[0], (tuple, list)):
             args = args[0]
 
-        cursor = self.cursor()
+        cursor = self._get_cursor()
         return cursor.execute(sql, args)
 
     def execute_many(self, sql, args):
         '''调用 cursor.executemany 方法'''
-        cursor = self.cursor()
+        cursor = self._get_cursor()
         return cursor.executemany(sql, args)
 
     @property
@@ -279,19 +382,19 @@ class Connection(pymysql.connections.Connection):
 
     def fetch_all(self, sql, *args):
         '''取出所有结果集'''
-        cursor = self.cursor()
+        cursor = self._get_cursor()
         cursor.execute(sql, *args)
         return cursor.fetchall()
 
     def fetch_row(self, sql, *args):
         '''取出第一行结果集'''
-        cursor = self.cursor()
+        cursor = self._get_cursor()
         cursor.execute(SQLHelper.limit(sql, 1), *args)
         return cursor.fetchone()
 
     def fetch_column(self, sql, *args, column=0):
         '''取出第一行指定列结果集'''
-        cursor = self.cursor(pymysql.cursors.Cursor)
+        cursor = self._get_cursor(pymysql.cursors.Cursor)
         cursor.execute(SQLHelper.limit(sql, 1), *args)
         rowset = cursor.fetchone()
         return rowset[column] if rowset and column < len(rowset) else None
@@ -300,7 +403,8 @@ class Connection(pymysql.connections.Connection):
         '''取出第一行第一列结果集'''
         return self.fetch_column(sql, *args, column=0)
 
-    def fetch_iterator(self, sql, *args, max=0, per=100, callback=None):
+    def fetch_iterator(self, sql, *args, max=0, per=100, callback=None, dict_rows=True,
+                       stream=False):
         '''根据 SQL 迭代查询数据库
 
         可为大数据量的查询提供便捷的查询操作，对比 cursor 具有更好的性能
@@ -314,33 +418,79 @@ class Connection(pymysql.connections.Connection):
         例如：
             for row in mysql.fetch_iterator(sql, per=5000):
                 print(row)
+
+        默认使用 limit ... offset ... 分批查询，每批 per 条记录；
+        当 dict_rows=False 时，以 tuple 表示每一行结果，不再逐行构造 dict
+
+        当 stream=True 时，使用服务端游标(SSDictCursor/SSCursor)流式读取结果集，
+        避免 offset 分页时数据库重复扫描已读取的记录，此时 per 只用于计算传给
+        callback 的批次序号，max 会以 limit 的形式加入 SQL 中。
+        注意：在迭代结束前，不能在同一个连接上执行其它查询(包括 callback 中)，
+        否则未读取完的结果集会被丢弃，迭代将提前结束且不会抛出异常
+        提前结束迭代(callback 返回 False 或在循环中 break)时，关闭游标会读完剩余的
+        结果集，因此流式读取时应尽量设置 max，避免读取整个结果集
         '''
-        import math
+        if stream:
+            cursorclass = pymysql.cursors.SSDictCursor if dict_rows else pymysql.cursors.SSCursor
+            yield from self._stream_rows(cursorclass, sql, args,
+                                         max=max, per=per, callback=callback)
+            return
+
         if not SQLHelper.is_select(sql) or SQLHelper.is_limited(sql):
             raise SQLError(sql)
 
+        # 分页 SQL 的前缀在各页之间不变，只需生成一次
+        base_sql = '%s limit %d offset ' % (sql, per)
+        cursor = self._get_cursor(None if dict_rows else pymysql.cursors.Cursor)
+        is_callable = callable(callback)
         offset = index = 0
         results = []
 
         while True:
             if max and offset >= max:
-                return StopIteration
+                return
 
-            steps = math.floor(offset / per) + 1
-            if hasattr(callback, '__call__') and callback(offset, steps) is False:
-                return StopIteration
+            if is_callable and callback(offset, offset // per + 1) is False:
+                return
 
             if index >= len(results):
                 index = 0
-                results = self.fetch_all('%s limit %d offset %d' %
-                                         (sql, per, offset), *args)
+                cursor.execute(base_sql + str(offset), *args)
+                results = cursor.fetchall()
                 if not results:
-                    return StopIteration
+                    return
 
             offset += 1
             index += 1
             yield results[index - 1]
 
+    def _stream_rows(self, cursorclass, sql, args, max=0, per=100, callback=None):
+        '''使用服务端游标逐行读取结果集'''
+        if not SQLHelper.is_select(sql):
+            raise SQLError(sql)
+
+        # 提前结束时 cursor.close() 会读完剩余的结果集，因此由数据库限制返回行数
+        if max:
+            sql = SQLHelper.limit(sql, max)
+
+        cursor = self.cursor(cursorclass)
+        try:
+            cursor.execute(sql, *args)
+
+            is_callable = callable(callback)
+            offset = 0
+            for row in cursor:
+                if max and offset >= max:
+                    return
+
+                if is_callable and callback(offset, offset // per + 1) is False:
+                    return
+
+                offset += 1
+                yield row
+        finally:
+            cursor.close()
+
     def transaction(self):
         '''使用 with 语法开启事务，以减少对 try/catch 的依赖，并自动 commit/rollback
 
@@ -365,19 +515,16 @@ class Connection(pymysql.connections.Connection):
         db.insert('insert ignore into mytable', foo=1, bar=2)
         db.insert('insert ignore into mytable', **dict(foo=1, bar=2))
         '''
-        match = re.search(r'(^\s*(insert|replace)\s+.*into\s+[`\.\w]+)(.*$)', sql, RE_FLAG)
+        match = _match_insert(sql)
         if data and match:
             escaped = self.escape(data)
 
-            groups = [s.strip() for s in match.groups()]
-            groups.pop(1)
-            groups.insert(-1, '(%s)' % ', '.join(SQLHelper.identifier(list(escaped.keys()))))
-            groups.insert(-1, 'values')
-            groups.insert(-1, '(%s)' % ', '.join(escaped.values()))
-
-            sql = ' '.join(groups)
+            sql = '%s (%s) values (%s) %s' % (match.group(1).strip(),
+                                              ', '.join(map(SQLHelper.identifier, escaped)),
+                                              ', '.join(escaped.values()),
+                                              match.group(3).strip())
 
-        if not SQLHelper.is_insert(sql):
+        if VALIDATE_SQL and not SQLHelper.is_insert(sql):
             raise SQLError(sql)
 
         return self.execute(sql, *args)
@@ -398,17 +545,20 @@ class Connection(pymysql.connections.Connection):
         if len(columns) is not len(datalist[0]):
             raise ValueError("Coumns count doesn't match datalist values")
 
-        match = re.search(r'(^\s*(insert|replace)\s+.*into\s+[`\.\w]+)(.*$)', sql, RE_FLAG)
+        match = _match_insert(sql)
         if not match:
             raise SQLError(sql)
 
-        groups = [s.strip() for s in match.groups()]
-        groups.pop(1)
-        groups.insert(-1, '(%s)' % ', '.join(SQLHelper.identifier(columns)))
-        groups.insert(-1, 'values')
-        groups.insert(-1, ', '.join(['(%s)' % ', '.join(map(self.escape, v)) for v in datalist]))
+        # 使用同一个占位符模板，由 cursor.mogrify 转义每一行数据
+        cursor = self._get_cursor()
+        placeholder = '(%s)' % ', '.join(['%s'] * len(columns))
+        values = ', '.join(cursor.mogrify(placeholder, row) for row in datalist)
+
+        sql = '%s (%s) values %s %s' % (match.group(1).strip(),
+                                        ', '.join(SQLHelper.identifier(columns)),
+                                        values, match.group(3).strip())
 
-        return self.execute(' '.join(groups))
+        return self.execute(sql)
 
     def update(self, sql, *args, **data):
         '''执行 update 操作
@@ -417,17 +567,20 @@ class Connection(pymysql.connections.Connection):
         db.update('update mytable where id < %s and id > %s', [10, 5], foo=1, bar=2)
         db.update('update mytable where id < %s and id > %s', *[10, 5], **dict(foo=1, bar=2))
         '''
-        match = re.search(r'(^\s*update\s+[`\.\w]+)\s+(.*$)', sql, RE_FLAG)
-        if data and match:
-            sets = ["{} = {}".format(SQLHelper.identifier(k), v)
-                    for (k, v) in self.escape(data).items()]
+        if data:
+            match = _match_update(sql)
+            if not match:
+                raise SQLError(sql)
+
+            sets = ', '.join(SQLHelper.identifier(k) + ' = ' + v
+                             for k, v in self.escape(data).items())
 
-            groups = [s.strip() for s in match.groups()]
-            groups.insert(-1, 'set')
-            groups.insert(-1, ', '.join(sets))
-            sql = ' '.join(groups)
+            sql = '%s set %s %s' % (match.group(1).strip(), sets, match.group(2).strip())
+        elif not _RE_UPDATE_SET.search(sql):
+            # 没有传入更新数据时，SQL 语句本身必须带有 set 子句
+            raise SQLError(sql)
 
-        if not SQLHelper.is_update(sql):
+        if VALIDATE_SQL and not SQLHelper.is_update(sql):
             raise SQLError(sql)
 
         return self.execute(sql, *args)
@@ -437,7 +590,7 @@ class Connection(pymysql.connections.Connection):
         db.delete('delete from mytable id < %s and id > %s', 10, 5)
         db.delete('delete from mytable id < %s and id > %s', [10, 5])
         '''
-        if not SQLHelper.is_delete(sql):
+        if VALIDATE_SQL and not SQLHelper.is_delete(sql):
             raise SQLError(sql)
 
         return self.execute(sql, *args)
@@ -457,25 +610,41 @@ class ConnectionPooled(object):
     使用连接池执行 SQL：
         with pooled.pool() as connection:
             connection.execute(sql)
+
+    设置 eager=True 时，在创建时即建立不进入连接池的连接
     '''
 
-    # 这个连接，是不进入连接池的
-    _connection = None
+    __slots__ = ('_factory', '_pool', '_connection')
 
     _defaults = dict(max_size=POOL_SIZE, max_usage=POOL_USAGES, ttl=POOL_TTL, idle=POOL_IDLE)
 
-    def __init__(self, pool_options=None, **kwargs):
-        self._configurations = kwargs
+    def __init__(self, pool_options=None, eager=False, **kwargs):
+        # 连接参数只在这里绑定一次，连接池创建连接时直接调用
+        self._factory = functools.partial(Connection, **kwargs)
         pool_options = pool_options or {}
-        self._pool = ConnectionPool(self._connect, **{**self._defaults, **pool_options})
+        self._pool = ConnectionPool(self._factory, **{**self._defaults,
+                                                      'close': self._close_connection,
+                                                      **pool_options})
+
+        # 这个连接，是不进入连接池的
+        self._connection = self._factory() if eager else None
+
+    @staticmethod
+    def _close_connection(connection):
+        '''连接池销毁连接(闲置、超时、超出使用次数)时关闭它
 
-    def _connect(self):
-        return Connection(**self._configurations)
+        复用的 cursor 与连接之间存在循环引用，不关闭的话，连接及其 socket
+        要等到循环垃圾回收时才会被释放
+        '''
+        if connection.open:
+            connection.close()
+        else:
+            connection._release_cursors()
 
     @property
     def connection(self):
         if not self._connection:
-            self._connection = self._connect()
+            self._connection = self._factory()
         return self._connection
 
     def pool(self):
@@ -504,10 +673,13 @@ class ConnectionManager(object):
         with dm.connection('foo').pool() as connection: pass
     '''
 
+    __slots__ = ('_configurations', '_connections', '_default', '_default_conn')
+
     def __init__(self, default='default', **configurations):
         self._configurations = configurations
         self._connections = {}
         self._default = default
+        self._default_conn = None
 
     @property
     def default(self):
@@ -532,7 +704,10 @@ class ConnectionManager(object):
 
     def __getattr__(self, method):
         '''允许直接调用默认数据库连接的方法'''
-        return getattr(self.connection(), method)
+        # 缓存默认连接，避免每次都按名称查找
+        if self._default_conn is None:
+            self._default_conn = self.connection()
+        return getattr(self._default_conn, method)
 
     def __getitem__(self, name):
         '''获取一个数据库连接'''